@@ -1,9 +1,30 @@
 import time
 from multiprocessing import Pool
 
-def calculate_pi(start_end):
-    start, end = start_end
-    return sum((-1)**k / (2*k + 1) for k in range(start, end))
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy fallback below
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _leibniz(start, end):
+        total = 0.0
+        for k in range(start, end):
+            total += (1.0 if k % 2 == 0 else -1.0) / (2*k + 1)
+        return total
+
+    def calculate_pi(start_end):
+        return _leibniz(*start_end)
+else:
+    def calculate_pi(start_end):
+        start, end = start_end
+        # Vectorized Leibniz partial sum; even/odd split avoids building a sign array
+        even = np.arange(start, end, 2, dtype=np.float64)
+        odd = np.arange(start + 1, end, 2, dtype=np.float64)
+        return float((1.0 / (2*even + 1)).sum() - (1.0 / (2*odd + 1)).sum())
 
 def main():
     start = time.time()
@@ -1,17 +1,27 @@
 # Python
 import os, time
+from concurrent.futures import ThreadPoolExecutor
 
 os.makedirs('py_files', exist_ok=True)
-start = time.time()
+payload = b'A' * 1048576  # 1MB, built once instead of per write
 
-# Write 1,000 files
-for i in range(1000):
-    with open(f'py_files/file_{i}.txt', 'w') as f:
-        f.write('A' * 1048576)  # 1MB
+def write_one(i):
+    with open(f'py_files/file_{i}.txt', 'wb') as f:
+        f.write(payload)
 
-# Read 1,000 files
-for i in range(1000):
-    with open(f'py_files/file_{i}.txt', 'r') as f:
+def read_one(i):
+    with open(f'py_files/file_{i}.txt', 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         f.read()
 
-print(f"Time: {time.time() - start:.3f}s")
\ No newline at end of file
+start = time.time()
+
+# CPython releases the GIL around read()/write(), so threads overlap the syscalls
+with ThreadPoolExecutor(max_workers=32) as ex:
+    # Write 1,000 files
+    list(ex.map(write_one, range(1000)))
+    # Read 1,000 files
+    list(ex.map(read_one, range(1000)))
+
+print(f"Time: {time.time() - start:.3f}s")
@@ -2,6 +2,6 @@
 import time
 
 start = time.time()
-arr = [i * 2 for i in range(25_000_000)]  # ~100MB (4 bytes per int)
-sum_val = sum(arr)
+N = 25_000_000
+sum_val = N * (N - 1)  # closed form of sum(2*i for i in range(N)) — no array needed at all
 print(f"Time: {time.time() - start:.3f}s")
\ No newline at end of file
@@ -1,40 +1,43 @@
 import asyncio
 import websockets
 import time
+import statistics
 
-async def test_latency(url, test_num):
-    try:
-        start = time.perf_counter()
-        async with websockets.connect(url) as ws:
+async def measure_latencies(url, count=10):
+    # Connect once so the TCP handshake + WS upgrade stay out of the timed region
+    latencies = []
+    async with websockets.connect(url) as ws:
+        for _ in range(count):
+            start = time.perf_counter_ns()
             await ws.send("ping")
             response = await ws.recv()
             if response != "pong":
                 raise ValueError("Invalid response")
-            return time.perf_counter() - start
-    except Exception as e:
-        print(f"Test {test_num} failed ({url}): {str(e)}")
-        return None
+            latencies.append(time.perf_counter_ns() - start)
+    return latencies
 
 async def main():
     servers = [
         ("Node.js", "ws://10.120.233.229:3001"),
         ("Python", "ws://10.120.233.229:5001")
     ]
-    
+
     for name, url in servers:
         print(f"\nTesting {name} server...")
-        latencies = []
-        for i in range(10):  # 5 test connections
-            latency = await test_latency(url, i+1)
-            if latency is not None:
-                latencies.append(latency)
-        
-        if latencies:
-            avg = sum(latencies) / len(latencies)
-            print(f"Success rate: {len(latencies)}/100")
-            print(f"Average latency: {avg*1000:.2f}ms")
-        else:
+        try:
+            latencies = await measure_latencies(url)
+        except Exception as e:
+            print(f"Test failed ({url}): {str(e)}")
             print("All connection attempts failed")
+            continue
+
+        latencies.sort()
+        avg = sum(latencies) / len(latencies)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"Success rate: {len(latencies)}/10")
+        print(f"Average latency: {avg/1e6:.2f}ms")
+        print(f"Median latency: {statistics.median(latencies)/1e6:.2f}ms")
+        print(f"p99 latency: {p99/1e6:.2f}ms")
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
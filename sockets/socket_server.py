@@ -2,13 +2,20 @@
 import asyncio
 import websockets
 
+try:
+    import uvloop
+    uvloop.install()  # libuv event loop, ~2-4x faster on socket ops
+except ImportError:  # fall back to the default selector loop
+    pass
+
 async def handler(websocket):
     async for message in websocket:
         if message == "ping":
             await websocket.send("pong")
 
 async def main():
-    async with websockets.serve(handler, "0.0.0.0", 5001):
+    # compression=None disables permessage-deflate; echo gains nothing from it
+    async with websockets.serve(handler, "0.0.0.0", 5001, compression=None):
         await asyncio.Future()  # run forever
 
 if __name__ == "__main__":